@@ -24,4 +24,46 @@ Sit back and enjoy ✨
 
 #ChillMusic #Relaxing
 '''
-}
\ No newline at end of file
+}
+
+# Encoder profiles (see encoder_profiles.py for automatic selection)
+# crf is used unless a bitrate is given; gop_seconds is the keyframe interval,
+# converted to frames at the fps actually used for the render
+ENCODER_PROFILES = {
+    'static-still': {
+        'crf': 28,
+        'bitrate': None,
+        'preset': 'veryfast',
+        'tune': 'stillimage',
+        'gop_seconds': 50,
+        'fps': 6,
+        'threads': 2,
+    },
+    'light-motion': {
+        'crf': 23,
+        'bitrate': None,
+        'preset': 'veryfast',
+        'tune': 'film',
+        'gop_seconds': 10,
+        'fps': 24,
+        'threads': 2,
+    },
+    'heavy-effects': {
+        'crf': 20,
+        'bitrate': None,
+        'preset': 'medium',
+        'tune': None,
+        'gop_seconds': 2,
+        'fps': 30,
+        'threads': 4,
+    },
+    'draft': {
+        'crf': 32,
+        'bitrate': None,
+        'preset': 'ultrafast',
+        'tune': None,
+        'gop_seconds': 10,
+        'fps': 12,
+        'threads': 2,
+    },
+}
@@ -0,0 +1,70 @@
+from config import ENCODER_PROFILES
+
+# Above this length (seconds) or frame area, animated content drops to the cheaper light-motion profile
+LONG_DURATION = 600
+LARGE_FRAME_AREA = 1920 * 1080
+
+def get_encoder_profile(name, overrides=None):
+    """
+    Return a copy of a named encoder profile with optional overrides applied.
+
+    Parameters:
+    - name: Key in config.ENCODER_PROFILES
+    - overrides: dict of profile fields to replace (e.g. {'fps': 30})
+    """
+    if name not in ENCODER_PROFILES:
+        raise ValueError(
+            f"Unknown encoder profile '{name}'. Available: {', '.join(ENCODER_PROFILES)}"
+        )
+    profile = dict(ENCODER_PROFILES[name])
+    if overrides:
+        unknown = set(overrides) - set(profile)
+        if unknown:
+            raise ValueError(f"Unknown encoder settings: {', '.join(sorted(unknown))}")
+        profile.update(overrides)
+    return profile
+
+def select_encoder_profile(animated, duration, size):
+    """
+    Pick an encoder profile name from the composition.
+
+    Parameters:
+    - animated: True if any layer changes over time (see VideoEffects.is_animated)
+    - duration: Length of the video in seconds
+    - size: (width, height) of the output
+    """
+    if not animated:
+        return 'static-still'
+    width, height = size
+    if duration > LONG_DURATION or width * height > LARGE_FRAME_AREA:
+        return 'light-motion'
+    return 'heavy-effects'
+
+def resolve_encoder_profile(animated, duration, size, profile=None, overrides=None):
+    """Return the requested profile, or the automatically selected one, with overrides applied"""
+    name = profile or select_encoder_profile(animated, duration, size)
+    return get_encoder_profile(name, overrides)
+
+def writer_kwargs(profile):
+    """
+    Convert a profile into keyword arguments accepted by both
+    VideoClip.write_videofile and StreamingVideoRenderer.render (fps excluded,
+    but used to turn gop_seconds into a frame count).
+    """
+    ffmpeg_params = []
+    if not profile['bitrate'] and profile['crf'] is not None:
+        ffmpeg_params += ['-crf', str(profile['crf'])]
+    if profile['tune']:
+        ffmpeg_params += ['-tune', profile['tune']]
+    if profile['gop_seconds']:
+        # Keep the keyframe interval fixed in time whatever fps the profile ends up with
+        gop = max(1, int(round(profile['gop_seconds'] * profile['fps'])))
+        ffmpeg_params += ['-g', str(gop)]
+    return {
+        'codec': 'libx264',
+        'audio_codec': 'aac',
+        'bitrate': profile['bitrate'],
+        'preset': profile['preset'],
+        'threads': profile['threads'],
+        'ffmpeg_params': ffmpeg_params,
+    }
@@ -1,6 +1,9 @@
 import os
 from moviepy.editor import AudioFileClip, ImageClip, TextClip, CompositeVideoClip
 from config import DEFAULT_BG, BACKGROUNDS_DIR
+from stream_renderer import StreamingVideoRenderer
+from encoder_profiles import resolve_encoder_profile, writer_kwargs
+from video_effects import VideoEffects
 from PIL import Image
 
 class ChillMusicVideoCreator:
@@ -14,8 +17,9 @@ class ChillMusicVideoCreator:
             self.background_image_path = default_bg
 
     def create_video(self, audio_path, output_path, title="", artist="", 
-                    width=1280, fps=24, title_size=60, artist_size=30, 
-                    text_color="white"):
+                    width=1280, fps=None, title_size=60, artist_size=30, 
+                    text_color="white", streaming=False, effects_config=None,
+                    encoder_profile=None, encoder_options=None):
         """
         Create a music video with customizable settings.
         
@@ -25,10 +29,17 @@ class ChillMusicVideoCreator:
         - title: Song title
         - artist: Artist name
         - width: Video width (height will be calculated)
-        - fps: Frames per second
+        - fps: Frames per second (defaults to the encoder profile's fps)
         - title_size: Font size for title
         - artist_size: Font size for artist name
         - text_color: Color for text overlays
+        - streaming: Render through StreamingVideoRenderer so memory stays
+          constant in track length (recommended for long mixes)
+        - effects_config: dict of effects for VideoEffects.apply_effects
+        - encoder_profile: Name from config.ENCODER_PROFILES (picked from the
+          composition when not given)
+        - encoder_options: dict overriding individual profile settings
+          (an explicit fps takes precedence over encoder_options['fps'])
         """
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found at {audio_path}")
@@ -36,9 +47,13 @@ class ChillMusicVideoCreator:
             raise FileNotFoundError(f"Background image not found at {self.background_image_path}")
 
         try:
-            # Load audio
-            audio_clip = AudioFileClip(audio_path)
-            duration = audio_clip.duration
+            # Load audio (the streaming path only reads the duration from the header)
+            if streaming:
+                audio_clip = None
+                duration = StreamingVideoRenderer.get_audio_duration(audio_path)
+            else:
+                audio_clip = AudioFileClip(audio_path)
+                duration = audio_clip.duration
 
             # Create background - handle ANTIALIAS deprecation
             bg_img = Image.open(self.background_image_path)
@@ -78,22 +93,56 @@ class ChillMusicVideoCreator:
 
             # Compose final video
             video = CompositeVideoClip(clips)
-            video = video.set_audio(audio_clip)
+            size = video.size
+
+            # Background and text are static, so only time-varying effects animate the video
+            animated = VideoEffects.is_animated(effects_config)
+            if effects_config:
+                video = VideoEffects.apply_effects(video, effects_config)
+
+            overrides = dict(encoder_options or {})
+            if fps:
+                overrides['fps'] = fps
+            profile = resolve_encoder_profile(
+                animated, duration, size, encoder_profile, overrides
+            )
+            fps = profile['fps']
 
             # Create output directory if needed
             os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
 
-            # Write video with minimal settings
             print("Creating video...")
-            video.write_videofile(
-                output_path,
-                fps=fps,
-                codec='libx264',
-                audio_codec='aac',
-                bitrate='2000k',
-                threads=2,
-                preset='ultrafast'
-            )
+            if streaming:
+                renderer = StreamingVideoRenderer(size[0], size[1], fps=fps)
+                if animated:
+                    # Redraw the shared buffer from the composition for every frame
+                    def update_frame(t, frame):
+                        renderer.load_frame(video.get_frame(t))
+                else:
+                    # A static composition is rendered once and that frame is reused
+                    renderer.load_frame(video.get_frame(0))
+                    update_frame = None
+                    for clip in clips:
+                        clip.close()
+                    video.close()
+                renderer.render(
+                    audio_path,
+                    output_path,
+                    duration=duration,
+                    update_frame=update_frame,
+                    **writer_kwargs(profile)
+                )
+                if animated:
+                    for clip in clips:
+                        clip.close()
+                    video.close()
+            else:
+                video = video.set_audio(audio_clip)
+                video.write_videofile(
+                    output_path,
+                    fps=fps,
+                    **writer_kwargs(profile)
+                )
             
             # Clean up temporary file
             if os.path.exists('temp_bg.jpg'):
@@ -116,7 +165,8 @@ class ShortsVideoCreator:
                 raise FileNotFoundError(f"Background image not found at {default_bg}")
             self.background_image_path = default_bg
 
-    def create_short(self, audio_path, output_path, title="", caption="", max_duration=60):
+    def create_short(self, audio_path, output_path, title="", caption="", max_duration=60,
+                     effects_config=None, encoder_profile=None, encoder_options=None):
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found at {audio_path}")
         if not os.path.exists(self.background_image_path):
@@ -175,15 +225,22 @@ class ShortsVideoCreator:
 
             # Compose final video
             video = CompositeVideoClip(clips, size=(1080, 1920))
+
+            # Background and text are static, so only time-varying effects animate the video
+            animated = VideoEffects.is_animated(effects_config)
+            if effects_config:
+                video = VideoEffects.apply_effects(video, effects_config)
             video = video.set_audio(audio_clip)
 
+            profile = resolve_encoder_profile(
+                animated, duration, (1080, 1920), encoder_profile, encoder_options
+            )
+
             # Write the final video
             video.write_videofile(
                 output_path,
-                fps=30,
-                codec='libx264',
-                audio_codec='aac',
-                preset='medium'
+                fps=profile['fps'],
+                **writer_kwargs(profile)
             )
             
             # Clean up
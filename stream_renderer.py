@@ -0,0 +1,101 @@
+import math
+import subprocess
+import tempfile
+import numpy as np
+from moviepy.config import get_setting
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+class StreamingVideoRenderer:
+    """
+    Render a video straight into an ffmpeg pipe with memory that does not
+    grow with track length.
+
+    The frame is kept in one preallocated uint8 buffer that is written to
+    the encoder for every frame, and the audio is muxed by ffmpeg from the
+    source file so it is never decoded into Python.
+    """
+
+    def __init__(self, width, height, fps=24):
+        # libx264 with yuv420p needs even dimensions
+        self.source_size = (height, width)
+        self.width = width - width % 2
+        self.height = height - height % 2
+        self.fps = fps
+        self.frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def load_frame(self, image):
+        """Copy an RGB(A) image into the frame buffer, trimming the odd row/column if any"""
+        image = np.asarray(image)
+        if image.shape[:2] not in (self.source_size, (self.height, self.width)):
+            raise ValueError(
+                f"Frame is {image.shape[1]}x{image.shape[0]} but the renderer was created for "
+                f"{self.source_size[1]}x{self.source_size[0]}; every frame must have the output size"
+            )
+        np.copyto(self.frame, image[:self.height, :self.width, :3], casting='unsafe')
+
+    @staticmethod
+    def get_audio_duration(audio_path):
+        """Read the audio duration from the container header without decoding it"""
+        return ffmpeg_parse_infos(audio_path)['duration']
+
+    def render(self, audio_path, output_path, duration=None, update_frame=None,
+               codec='libx264', audio_codec='aac', bitrate='2000k',
+               preset='ultrafast', threads=2, ffmpeg_params=None):
+        """
+        Encode the frame buffer for the length of the audio track.
+
+        Parameters:
+        - audio_path: Audio file muxed into the output
+        - output_path: Where to save the video
+        - duration: Length in seconds (defaults to the audio duration)
+        - update_frame: Optional callable (t, frame) that redraws the buffer in place
+        - codec, audio_codec, bitrate, preset, threads: Encoder settings
+        - ffmpeg_params: Extra output options, as in VideoClip.write_videofile
+        """
+        if duration is None:
+            duration = self.get_audio_duration(audio_path)
+        n_frames = int(math.ceil(duration * self.fps))
+
+        cmd = [
+            get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-vcodec', 'rawvideo',
+            '-s', f'{self.width}x{self.height}', '-pix_fmt', 'rgb24',
+            '-r', str(self.fps), '-i', '-',
+            '-i', audio_path,
+            '-map', '0:v:0', '-map', '1:a:0',
+            '-t', f'{duration:.3f}',
+            '-c:v', codec, '-preset', preset,
+            '-threads', str(threads),
+            '-pix_fmt', 'yuv420p',
+            '-c:a', audio_codec,
+        ]
+        if bitrate:
+            cmd += ['-b:v', bitrate]
+        if ffmpeg_params:
+            cmd += list(ffmpeg_params)
+        cmd.append(output_path)
+
+        # ffmpeg's log goes to a temp file so a chatty encoder cannot fill the pipe and block us
+        with tempfile.TemporaryFile() as log:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log)
+            frame_bytes = memoryview(self.frame).cast('B')
+            try:
+                for i in range(n_frames):
+                    if update_frame is not None:
+                        update_frame(i / self.fps, self.frame)
+                    proc.stdin.write(frame_bytes)
+            except BrokenPipeError:
+                pass
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+                proc.wait()
+
+            if proc.returncode != 0:
+                log.seek(0)
+                error = log.read().decode(errors='replace')
+                raise IOError(f"ffmpeg failed while writing {output_path}:\n{error}")
+
+        return output_path
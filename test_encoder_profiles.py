@@ -0,0 +1,131 @@
+import os
+import tempfile
+from unittest import mock
+from encoder_profiles import get_encoder_profile, select_encoder_profile, writer_kwargs
+from music_video_creator import ChillMusicVideoCreator, ShortsVideoCreator
+
+def render_with_mocks(create, streaming=False, duration=180, size=(1280, 720), **kwargs):
+    """
+    Run create_video (or create_short) with moviepy and PIL mocked out and
+    return the keyword arguments the encoder was called with.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_path = os.path.join(tmp, "track.mp3")
+        bg_path = os.path.join(tmp, "bg.jpg")
+        for path in (audio_path, bg_path):
+            open(path, 'wb').close()
+
+        video = mock.MagicMock(size=size, w=size[0], h=size[1])
+        for method in ('set_audio', 'resize', 'fl', 'set_duration'):
+            getattr(video, method).return_value = video
+        image = mock.MagicMock(width=1920, height=1080)
+        image.resize.return_value = image
+        image.crop.return_value = image
+        audio = mock.MagicMock(duration=duration)
+        audio.subclip.return_value = audio
+
+        with mock.patch('music_video_creator.AudioFileClip', return_value=audio), \
+             mock.patch('music_video_creator.ImageClip'), \
+             mock.patch('music_video_creator.TextClip'), \
+             mock.patch('music_video_creator.CompositeVideoClip', return_value=video), \
+             mock.patch('music_video_creator.Image') as pil, \
+             mock.patch('music_video_creator.StreamingVideoRenderer') as renderer:
+            pil.open.return_value = image
+            renderer.get_audio_duration.return_value = duration
+            if create == 'short':
+                assert ShortsVideoCreator(bg_path).create_short(
+                    audio_path, os.path.join(tmp, "out.mp4"), title="Title", **kwargs)
+            else:
+                ChillMusicVideoCreator(bg_path).create_video(
+                    audio_path, os.path.join(tmp, "out.mp4"), title="Title",
+                    streaming=streaming, **kwargs)
+
+        if streaming:
+            call = renderer.return_value.render.call_args
+            return dict(call.kwargs, fps=renderer.call_args.kwargs['fps'])
+        return video.write_videofile.call_args.kwargs
+
+def option(kwargs, flag):
+    params = kwargs['ffmpeg_params']
+    return params[params.index(flag) + 1] if flag in params else None
+
+def test_profile_selection():
+    # Static chill visuals always get the cheap still-image profile
+    assert select_encoder_profile(False, 3600, (1280, 720)) == 'static-still'
+    assert select_encoder_profile(False, 60, (1080, 1920)) == 'static-still'
+    # Animated content drops to light-motion when long or larger than 1080p
+    assert select_encoder_profile(True, 60, (1080, 1920)) == 'heavy-effects'
+    assert select_encoder_profile(True, 3600, (1280, 720)) == 'light-motion'
+    assert select_encoder_profile(True, 60, (3840, 2160)) == 'light-motion'
+
+def test_profile_overrides():
+    profile = get_encoder_profile('static-still', {'fps': 12, 'bitrate': '1000k'})
+    assert profile['fps'] == 12
+    kwargs = writer_kwargs(profile)
+    # An explicit bitrate replaces CRF
+    assert kwargs['bitrate'] == '1000k'
+    assert '-crf' not in kwargs['ffmpeg_params']
+    # The 50 second GOP is converted at the overridden 12 fps
+    assert kwargs['ffmpeg_params'] == ['-tune', 'stillimage', '-g', '600']
+
+def test_unknown_profile_or_setting_raises():
+    for name, overrides in (('cinematic', None), ('draft', {'bframes': 3})):
+        try:
+            get_encoder_profile(name, overrides)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {name} {overrides}")
+
+def test_gop_follows_fps():
+    # The keyframe interval stays at 50 seconds when fps is overridden
+    assert option(writer_kwargs(get_encoder_profile('static-still')), '-g') == '300'
+    assert option(writer_kwargs(get_encoder_profile('static-still', {'fps': 24})), '-g') == '1200'
+
+def test_create_video_uses_selected_profile():
+    kwargs = render_with_mocks('video')
+    assert (kwargs['fps'], kwargs['preset']) == (6, 'veryfast')
+    assert (option(kwargs, '-crf'), option(kwargs, '-tune'), option(kwargs, '-g')) == ('28', 'stillimage', '300')
+
+    # Streaming renders get the same settings
+    kwargs = render_with_mocks('video', streaming=True)
+    assert (kwargs['fps'], kwargs['preset']) == (6, 'veryfast')
+    assert (option(kwargs, '-crf'), option(kwargs, '-tune'), option(kwargs, '-g')) == ('28', 'stillimage', '300')
+
+    # Animated effects move a short render to heavy-effects and a long one to light-motion
+    zoom = {'zoom': {'enabled': True}}
+    kwargs = render_with_mocks('video', effects_config=zoom)
+    assert (kwargs['fps'], kwargs['preset'], option(kwargs, '-g')) == (30, 'medium', '60')
+    kwargs = render_with_mocks('video', streaming=True, duration=3600, effects_config=zoom)
+    assert (kwargs['fps'], option(kwargs, '-tune'), option(kwargs, '-g')) == (24, 'film', '240')
+    assert kwargs['update_frame'] is not None
+
+def test_create_video_profile_overrides():
+    kwargs = render_with_mocks('video', encoder_profile='draft')
+    assert (kwargs['fps'], kwargs['preset'], option(kwargs, '-crf'), option(kwargs, '-g')) == (12, 'ultrafast', '32', '120')
+
+    kwargs = render_with_mocks('video', encoder_options={'fps': 30})
+    assert (kwargs['fps'], kwargs['preset'], option(kwargs, '-g')) == (30, 'veryfast', '1500')
+
+    kwargs = render_with_mocks('video', streaming=True, fps=24)
+    assert (kwargs['fps'], option(kwargs, '-tune'), option(kwargs, '-g')) == (24, 'stillimage', '1200')
+
+def test_create_short_uses_selected_profile():
+    kwargs = render_with_mocks('short', size=(1080, 1920))
+    assert (kwargs['fps'], option(kwargs, '-tune')) == (6, 'stillimage')
+
+    kwargs = render_with_mocks('short', size=(1080, 1920), effects_config={'fade': {'enabled': True}})
+    assert (kwargs['fps'], kwargs['preset']) == (30, 'medium')
+
+    kwargs = render_with_mocks('short', size=(1080, 1920), encoder_profile='draft',
+                               encoder_options={'fps': 30})
+    assert (kwargs['fps'], kwargs['preset'], option(kwargs, '-g')) == (30, 'ultrafast', '300')
+
+if __name__ == "__main__":
+    test_profile_selection()
+    test_profile_overrides()
+    test_unknown_profile_or_setting_raises()
+    test_gop_follows_fps()
+    test_create_video_uses_selected_profile()
+    test_create_video_profile_overrides()
+    test_create_short_uses_selected_profile()
+    print("Encoder profile tests passed")
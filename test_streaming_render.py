@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import tempfile
+from moviepy.config import get_setting
+
+# Runs create_video(streaming=True) in a fresh interpreter and prints the peak RSS (KB) of Python and of ffmpeg
+# (a child's peak includes the Python pages it inherits before exec, so the ffmpeg figure is an upper bound)
+RENDER_SCRIPT = '''
+import resource, sys
+sys.path.insert(0, sys.argv[1])
+from PIL import Image
+from music_video_creator import ChillMusicVideoCreator
+
+Image.new('RGB', (320, 180), (40, 40, 60)).save('bg.jpg')
+# No title or artist, so ImageMagick is not needed
+ChillMusicVideoCreator('bg.jpg').create_video(sys.argv[2], sys.argv[3], width=320, streaming=True)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+      resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+'''
+
+def make_synthetic_audio(path, seconds):
+    subprocess.run([
+        get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:duration={seconds}',
+        '-c:a', 'libmp3lame', '-b:a', '64k', path
+    ], check=True)
+
+def peak_rss(audio_path, output_path):
+    # Run from the output directory so create_video's temp_bg.jpg lands there
+    result = subprocess.run(
+        [sys.executable, '-c', RENDER_SCRIPT,
+         os.path.dirname(os.path.abspath(__file__)), audio_path, output_path],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(output_path)
+    )
+    python_rss, ffmpeg_rss = result.stdout.splitlines()[-1].split()
+    return int(python_rss), int(ffmpeg_rss)
+
+def test_streaming_render_memory_is_flat():
+    with tempfile.TemporaryDirectory() as tmp:
+        peaks = {}
+        for minutes in (5, 60):
+            audio_path = os.path.join(tmp, f"sine_{minutes}.mp3")
+            make_synthetic_audio(audio_path, minutes * 60)
+            peaks[minutes] = peak_rss(audio_path, os.path.join(tmp, f"out_{minutes}.mp4"))
+            print(f"{minutes} min: python {peaks[minutes][0]} KB, ffmpeg {peaks[minutes][1]} KB")
+
+        # 12x the duration should cost no more than noise on top of the 5 minute peak
+        for short_peak, long_peak in zip(peaks[5], peaks[60]):
+            assert long_peak <= short_peak * 1.1 + 10240, (peaks[5], peaks[60])
+
+if __name__ == "__main__":
+    test_streaming_render_memory_is_flat()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from moviepy.editor import VideoFileClip
+from PIL import Image, ImageDraw
+from music_video_creator import ChillMusicVideoCreator
+from test_streaming_render import make_synthetic_audio
+
+def render_with_effects(tmp, effects_config, streaming):
+    """Render a 4 second 320x180 video with effects and return (duration, size, frame at 3.5s)"""
+    audio_path = os.path.join(tmp, "sine.mp3")
+    if not os.path.exists(audio_path):
+        make_synthetic_audio(audio_path, 4)
+
+    # Dark background with a white square in the centre
+    bg_path = os.path.join(tmp, "bg.png")
+    bg = Image.new('RGB', (320, 180), (20, 20, 30))
+    ImageDraw.Draw(bg).rectangle((140, 70, 179, 109), fill=(255, 255, 255))
+    bg.save(bg_path)
+
+    output_path = os.path.join(tmp, f"out_{streaming}.mp4")
+    cwd = os.getcwd()
+    os.chdir(tmp)  # create_video writes temp_bg.jpg to the working directory
+    try:
+        ChillMusicVideoCreator(bg_path).create_video(
+            audio_path, output_path, width=320,
+            effects_config=effects_config, streaming=streaming
+        )
+    finally:
+        os.chdir(cwd)
+
+    clip = VideoFileClip(output_path)
+    try:
+        return clip.duration, tuple(clip.size), clip.get_frame(3.5)
+    finally:
+        clip.close()
+
+def test_zoom_render_keeps_size_and_centre():
+    with tempfile.TemporaryDirectory() as tmp:
+        for streaming in (False, True):
+            duration, size, frame = render_with_effects(tmp, {'zoom': {'enabled': True}}, streaming)
+            assert abs(duration - 4) < 0.5, (streaming, duration)
+            assert size == (320, 180), (streaming, size)
+            # Zooming towards the centre keeps the square there and the corners dark
+            assert frame[90, 160].mean() > 200, (streaming, frame[90, 160])
+            assert frame[5, 5].mean() < 100, (streaming, frame[5, 5])
+
+def test_static_effects_render():
+    with tempfile.TemporaryDirectory() as tmp:
+        effects = {'brightness': {'enabled': True}, 'blur': {'enabled': True},
+                   'color': {'enabled': True}}
+        duration, size, frame = render_with_effects(tmp, effects, streaming=False)
+        assert abs(duration - 4) < 0.5
+        assert size == (320, 180)
+
+if __name__ == "__main__":
+    test_zoom_render_keeps_size_and_centre()
+    test_static_effects_render()
+    print("Video effects tests passed")
@@ -1,28 +1,43 @@
 from moviepy.video.fx.all import *
 from moviepy.editor import *
+import numpy as np
+from PIL import Image, ImageColor, ImageFilter
 
 class VideoEffects:
+    # Effects whose output changes over time; the rest are applied identically to every frame
+    ANIMATED_EFFECTS = {'fade', 'zoom', 'wave'}
+
     @staticmethod
     def apply_fade(clip, duration=1.0):
         """Add fade in and fade out effect"""
-        return fade_in(fade_out(clip, duration), duration)
+        return fadein(fadeout(clip, duration), duration)
     
     @staticmethod
     def apply_zoom(clip, zoom_factor=1.3):
-        """Add slow zoom effect"""
-        def zoom(t):
-            return 1 + (zoom_factor - 1) * t / clip.duration
-        return clip.resize(zoom)
+        """Add slow zoom effect towards the centre, keeping the frame size"""
+        w, h = clip.size
+        resampling_method = getattr(Image, 'Resampling', Image).LANCZOS
+        def zoom(gf, t):
+            scale = 1 + (zoom_factor - 1) * t / clip.duration
+            # Scale the centre 1/scale of the frame back up to the full size
+            crop_w, crop_h = w / scale, h / scale
+            left, top = (w - crop_w) / 2, (h - crop_h) / 2
+            frame = Image.fromarray(np.uint8(gf(t)))
+            return np.array(frame.resize((w, h), resampling_method,
+                                         box=(left, top, left + crop_w, top + crop_h)))
+        return clip.fl(zoom)
     
     @staticmethod
     def apply_blur(clip, sigma=3):
         """Add blur effect"""
-        return blur(clip, sigma)
+        def blur_frame(frame):
+            return np.array(Image.fromarray(np.uint8(frame)).filter(ImageFilter.GaussianBlur(sigma)))
+        return clip.fl_image(blur_frame)
     
     @staticmethod
     def apply_brightness(clip, factor=1.2):
         """Adjust brightness"""
-        return multiply_color(clip, factor)
+        return colorx(clip, factor)
     
     @staticmethod
     def apply_vignette(clip, size=0.8):
@@ -48,7 +63,9 @@ class VideoEffects:
     @staticmethod
     def apply_color_effect(clip, color="blue", intensity=0.3):
         """Add color tint effect"""
-        color_clip = ColorClip(clip.size, col=color).set_duration(clip.duration)
+        if isinstance(color, str):
+            color = ImageColor.getrgb(color)
+        color_clip = ColorClip(clip.size, color=color).set_duration(clip.duration)
         return CompositeVideoClip([clip, color_clip.set_opacity(intensity)])
     
     @staticmethod
@@ -81,6 +98,14 @@ class VideoEffects:
             'wave': 'Wave distortion effect'
         }
 
+    @classmethod
+    def is_animated(cls, effects_config):
+        """Return True if any enabled effect in effects_config changes over time"""
+        return any(
+            effect in cls.ANIMATED_EFFECTS and params.get('enabled', False)
+            for effect, params in (effects_config or {}).items()
+        )
+
     @classmethod
     def apply_effects(cls, clip, effects_config):
         """